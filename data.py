@@ -1,6 +1,7 @@
+import sys
+
 with open("dataformat.jsonc") as f:
     file = f.read()
 
-for line in file.splitlines():
-    if "//" in line:
-        print(line.split("//")[1].strip())
\ No newline at end of file
+lines = [line.split("//")[1].strip() for line in file.splitlines() if "//" in line]
+sys.stdout.write("\n".join(lines) + "\n")
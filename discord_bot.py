@@ -182,29 +182,12 @@ Slumber Item: Glowing Sand Paper -- data["player"]["stats"]["Bedwars"]["slumber"
 Slumber Hotel: Total Tickets Earned -- data["player"]["stats"]["Bedwars"]["slumber"]["total_tickets_earned"]
 """
 
-import requests
-import config
-import json
+import fetch
 from thefuzz import process, fuzz
 import re
 
-def cache_data(player: str, data: dict):
-    with open("cache.json", "r") as f:
-        d = json.load(f)
-        d[player] = data
+logger = logging.getLogger(__name__)
 
-    with open("cache.json", "w") as f:
-        json.dump(d, f)
-
-    
-def get_cached(player: str):
-    with open("cache.json", "r") as f:
-        d = json.load(f)
-        if player in d:
-            return d[player]
-        else:
-            return None
-        
 def get_or_none(data: dict, keys: list):
     for key in keys:
         if key in data:
@@ -215,16 +198,9 @@ def get_or_none(data: dict, keys: list):
         
 
 def get_data(player: str):
-    if get_cached(player):
-        d = get_cached(player)
-    else:
-        url = f"https://api.hypixel.net/player?name={player}"
-        headers = {
-            "API-Key": config.API_KEY
-        }
-        response = requests.get(url, headers=headers)
-        d = response.json()
-        cache_data(player, d)
+    d = fetch.get_data(player)
+    if d is None:
+        return None
     data = {
         # "First Time Played": d["player"]["firstLogin"],
         "First Time Played": get_or_none(d, ["player", "firstLogin"]),
@@ -575,7 +551,10 @@ def full_data(l, d):
     
     return [(x, d[x]) for x in filtered]
 
-print(full_data(list(get_data("suspiciousitem").keys()), get_data("suspiciousitem")))
+if logger.isEnabledFor(logging.DEBUG):
+    sample = get_data("suspiciousitem")
+    if sample is not None:
+        logger.debug("sample query: %s", full_data(list(sample.keys()), sample))
 
 
 
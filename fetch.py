@@ -0,0 +1,181 @@
+import asyncio
+import aiohttp
+from aiolimiter import AsyncLimiter
+import config
+import orjson
+import re
+import time
+
+UUID_TTL = 600
+UUID_CACHE_SIZE = 4096
+# minecraft names are [A-Za-z0-9_], so valid ones never need url quoting
+USERNAME_RE = re.compile(r"\A[A-Za-z0-9_]{1,16}\Z")
+RESPONSE_PATHS = (
+    "success",
+    "player.firstLogin",
+    "player.lastLogin",
+    "player.stats.SkyWars",
+    "player.stats.Bedwars",
+)
+
+# aiohttp sessions and rate limiters are bound to the loop that created them,
+# so keep one of each per event loop
+sessions = {}
+limiters = {}
+uuid_cache = {}
+
+# seconds a fetched player stays in cache.json
+PLAYER_TTL = 60
+player_cache = None
+
+
+def load_cache():
+    global player_cache
+    if player_cache is None:
+        try:
+            with open("cache.json", "rb") as f:
+                player_cache = orjson.loads(f.read())
+        except FileNotFoundError:
+            player_cache = {}
+    return player_cache
+
+
+def is_fresh(entry: dict, now: float):
+    return now - entry.get("fetched", 0) < PLAYER_TTL
+
+
+def cache_data(player: str, data: dict):
+    cache = load_cache()
+    now = time.time()
+    for key in [k for k, v in cache.items() if not is_fresh(v, now)]:
+        del cache[key]
+    cache[player.lower()] = {"fetched": now, "data": data}
+
+    with open("cache.json", "wb") as f:
+        f.write(orjson.dumps(cache))
+
+
+def get_cached(player: str):
+    entry = load_cache().get(player.lower())
+    if entry and is_fresh(entry, time.time()):
+        return entry["data"]
+    return None
+
+
+async def get_session():
+    loop = asyncio.get_running_loop()
+    session = sessions.get(loop)
+    if session is None or session.closed:
+        session = sessions[loop] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        )
+    return session
+
+
+def get_limiter():
+    loop = asyncio.get_running_loop()
+    if loop not in limiters:
+        # Hypixel allows 120 requests per minute per key
+        limiters[loop] = AsyncLimiter(120, 60)
+    return limiters[loop]
+
+
+async def close_session():
+    loop = asyncio.get_running_loop()
+    limiters.pop(loop, None)
+    session = sessions.pop(loop, None)
+    if session is not None:
+        await session.close()
+
+
+async def fetch_json(session, url, headers=None, paths=None):
+    async with session.get(url, headers=headers) as response:
+        if response.status != 200:
+            return None
+        try:
+            d = orjson.loads(await response.read())
+        except orjson.JSONDecodeError:
+            return None
+    return d if paths is None else select_paths(d, paths)
+
+
+async def resolve_uuid(session, player: str):
+    key = player.lower()
+    if key in uuid_cache:
+        uuid, fetched = uuid_cache[key]
+        if time.monotonic() - fetched < UUID_TTL:
+            return uuid
+
+    d = await fetch_json(session, f"https://api.mojang.com/users/profiles/minecraft/{player}")
+    if not d or "id" not in d:
+        return None
+
+    now = time.monotonic()
+    uuid_cache.pop(key, None)
+    if len(uuid_cache) >= UUID_CACHE_SIZE:
+        for k in [k for k, (_, fetched) in uuid_cache.items() if now - fetched >= UUID_TTL]:
+            del uuid_cache[k]
+    if len(uuid_cache) >= UUID_CACHE_SIZE:
+        # still full of fresh entries: drop the oldest one
+        del uuid_cache[next(iter(uuid_cache))]
+    uuid_cache[key] = (d["id"], now)
+    return d["id"]
+
+
+def store(d: dict, path: str, value):
+    *parents, key = path.split(".")
+    for parent in parents:
+        d = d.setdefault(parent, {})
+    d[key] = value
+
+
+def select_paths(d: dict, paths):
+    # keep only the parts of the (large) response that are asked for
+    selected = {}
+    for path in paths:
+        value = d
+        for key in path.split("."):
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            store(selected, path, value)
+    return selected
+
+
+async def fetch_player(session, uuid: str):
+    url = f"https://api.hypixel.net/v2/player?uuid={uuid}"
+    async with get_limiter():
+        d = await fetch_json(session, url, headers={"API-Key": config.API_KEY}, paths=RESPONSE_PATHS)
+    if not d or not d.get("success"):
+        return None
+    return d
+
+
+async def get_player(player: str):
+    if not USERNAME_RE.match(player):
+        return None
+
+    d = get_cached(player)
+    # treat a cached error payload like a miss, the same as fetch_player would
+    if not d or not d.get("success"):
+        session = await get_session()
+        uuid = await resolve_uuid(session, player)
+        if uuid is None:
+            return None
+        d = await fetch_player(session, uuid)
+        if d is None:
+            return None
+        cache_data(player, d)
+    return d
+
+
+def get_data(player: str):
+    # sync entry point for scripts, on its own loop and session
+    async def run():
+        try:
+            return await get_player(player)
+        finally:
+            await close_session()
+
+    return asyncio.run(run())
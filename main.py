@@ -172,32 +172,215 @@ Slumber Item: Glowing Sand Paper -- data["player"]["stats"]["Bedwars"]["slumber"
 Slumber Hotel: Total Tickets Earned -- data["player"]["stats"]["Bedwars"]["slumber"]["total_tickets_earned"]
 """
 
-import requests
-import config
-import json
+import asyncio
+from fetch import get_player
 from thefuzz import process, fuzz
 import re
 import discord
 from dotenv import load_dotenv
 import os
 
-def cache_data(player: str, data: dict):
-    with open("cache.json", "r") as f:
-        d = json.load(f)
-        d[player] = data
+PLAYER_STATS = (
+    ("First Time Played", "firstLogin"),
+    ("Last Time Played", "lastLogin"),
+)
+
+SKYWARS_STATS = (
+    ("Skywars Souls", "souls"),
+    ("Skywars Coins", "coins"),
+    ("Skywars Experience", "skywars_experience"),
+    ("Skywars Deaths", "deaths"),
+    ("Skywars Deaths Solo", "deaths_solo"),
+    ("Skywars Deaths Solo Normal", "deaths_solo_normal"),
+    ("Skywars Losses", "losses"),
+    ("Skywars Losses Solo", "losses_solo"),
+    ("Skywars Losses Solo Normal", "losses_solo_normal"),
+    ("Skywars Win Streak", "win_streak"),
+    ("Skywars Games Solo", "games_solo"),
+    ("Skywars Wins", "wins"),
+    ("Skywars Wins Solo", "wins_solo"),
+    ("Skywars Wins Solo Normal", "wins_solo_normal"),
+    ("Skywars Kills", "kills"),
+    ("Skywars Kills Solo", "kills_solo"),
+    ("Skywars Kills Solo Normal", "kills_solo_normal"),
+    ("Skywars Souls Gathered", "souls_gathered"),
+    ("Skywars Eggs Thrown", "egg_thrown"),
+    ("Skywars Assists", "assists"),
+    ("Skywars Assists Solo", "assists_solo"),
+    ("Skywars Enderpearls Thrown", "enderpearls_thrown"),
+    ("Skywars Deaths Solo Insane", "deaths_solo_insane"),
+    ("Skywars Losses Solo Insane", "losses_solo_insane"),
+    ("Skywars Arrows Hit", "arrows_hit"),
+    ("Skywars Arrows Shot", "arrows_shot"),
+    ("Skywars Deaths Team", "deaths_team"),
+    ("Skywars Deaths Team Insane", "deaths_team_insane"),
+    ("Skywars Losses Team", "losses_team"),
+    ("Skywars Losses Team Insane", "losses_team_insane"),
+    ("Skywars Wins Solo Insane", "wins_solo_insane"),
+    ("Skywars Kills Solo Insane", "kills_solo_insane"),
+    ("Skywars Soul Well", "soul_well"),
+    ("Skywars Soul Well Rares", "soul_well_rares"),
+    ("Skywars Games Team", "games_team"),
+    ("Skywars Heads", "heads"),
+    ("Skywars Heads Decent", "heads_decent"),
+    ("Skywars Heads Decent Team", "heads_decent_team"),
+    ("Skywars Heads Team", "heads_team"),
+    ("Skywars Kills Team", "kills_team"),
+    ("Skywars Kills Team Insane", "kills_team_insane"),
+    ("Skywars Assists Team", "assists_team"),
+    ("Skywars Deaths Team Normal", "deaths_team_normal"),
+    ("Skywars Wins Team", "wins_team"),
+    ("Skywars Wins Team Normal", "wins_team_normal"),
+    ("Skywars Losses Team Normal", "losses_team_normal"),
+    ("Skywars Kills Team Normal", "kills_team_normal"),
+    ("Skywars Soul Well Legendaries", "soul_well_legendaries"),
+    ("Skywars Heads Tasty", "heads_tasty"),
+    ("Skywars Heads Tasty Team", "heads_tasty_team"),
+    ("Skywars Heads Eww", "heads_eww"),
+    ("Skywars Heads Eww Team", "heads_eww_team"),
+    ("Skywars Heads Meh", "heads_meh"),
+    ("Skywars Heads Meh Team", "heads_meh_team"),
+    ("Skywars Heads Yucky", "heads_yucky"),
+    ("Skywars Heads Heavenly", "heads_heavenly"),
+    ("Skywars Heads Divine", "heads_divine"),
+    ("Skywars Heads Salty", "heads_salty"),
+    ("Skywars Heads Succulent", "heads_succulent"),
+)
+
+BEDWARS_STATS = (
+    ("Bedwars Experience", "Experience"),
+    ("Bedwars Winstreak", "winstreak"),
+    ("Bedwars Coins", "coins"),
+    ("Bedwars Deaths", "deaths_bedwars"),
+    ("Bedwars 4x4 4s Deaths", "four_four_deaths_bedwars"),
+    ("Bedwars 4x4 4s Games Played", "four_four_games_played_bedwars"),
+    ("Bedwars 4x4 4s Kills", "four_four_kills_bedwars"),
+    ("Bedwars 4x4 4s Wins", "four_four_wins_bedwars"),
+    ("Bedwars Games Played", "games_played_bedwars"),
+    ("Bedwars Gold Resources Collected", "gold_resources_collected_bedwars"),
+    ("Bedwars Iron Resources Collected", "iron_resources_collected_bedwars"),
+    ("Bedwars Kills", "kills_bedwars"),
+    ("Bedwars Wins", "wins_bedwars"),
+    ("Bedwars Beds Broken", "beds_broken_bedwars"),
+    ("Bedwars 8x2 2s Duo Beds Broken", "eight_two_beds_broken_bedwars"),
+    ("Bedwars 8x2 2s Duo Beds Lost", "eight_two_beds_lost_bedwars"),
+    ("Bedwars 8x2 2s Duo Deaths", "eight_two_deaths_bedwars"),
+    ("Bedwars 8x2 2s Duo Final Deaths", "eight_two_final_deaths_bedwars"),
+    ("Bedwars 8x2 2s Duo Final Kills", "eight_two_final_kills_bedwars"),
+    ("Bedwars 8x2 2s Duo Games Played", "eight_two_games_played_bedwars"),
+    ("Bedwars 8x2 2s Duo Losses", "eight_two_losses_bedwars"),
+    ("Bedwars Final Kills", "final_kills_bedwars"),
+    ("Bedwars Losses", "losses_bedwars"),
+    ("Bedwars 8x2 2s Duo Kills", "eight_two_kills_bedwars"),
+    ("Bedwars Void Kills", "void_kills_bedwars"),
+    ("Bedwars Emerald Resources Collected", "emerald_resources_collected_bedwars"),
+    ("Bedwars 4x4 4s Beds Lost", "four_four_beds_lost_bedwars"),
+    ("Bedwars 4x4 4s Final Deaths", "four_four_final_deaths_bedwars"),
+    ("Bedwars 4x4 4s Losses", "four_four_losses_bedwars"),
+    ("Bedwars 2x4 4v4 Beds Lost", "two_four_beds_lost_bedwars"),
+    ("Bedwars 2x4 4v4 Deaths", "two_four_deaths_bedwars"),
+    ("Bedwars 2x4 4v4 Final Deaths", "two_four_final_deaths_bedwars"),
+    ("Bedwars 2x4 4v4 Games Played", "two_four_games_played_bedwars"),
+    ("Bedwars 2x4 4v4 Losses", "two_four_losses_bedwars"),
+    ("Bedwars 2x4 4v4 Wins", "two_four_wins_bedwars"),
+    ("Bedwars Fall Deaths", "fall_deaths_bedwars"),
+    ("Bedwars Fall Kills", "fall_kills_bedwars"),
+    ("Bedwars 2x4 4v4 Kills", "two_four_kills_bedwars"),
+    ("Bedwars Diamond Resources Collected", "diamond_resources_collected_bedwars"),
+    ("Bedwars 4x4 4s Void Kills", "four_four_void_kills_bedwars"),
+    ("Bedwars Projectile Kills", "projectile_kills_bedwars"),
+    ("Bedwars 2x4 4v4 Beds Broken", "two_four_beds_broken_bedwars"),
+    ("Bedwars 8x1 1s Solo Deaths", "eight_one_deaths_bedwars"),
+    ("Bedwars 8x1 1s Solo Final Deaths", "eight_one_final_deaths_bedwars"),
+    ("Bedwars 8x1 1s Solo Games Played", "eight_one_games_played_bedwars"),
+    ("Bedwars 8x1 1s Solo Losses", "eight_one_losses_bedwars"),
+    ("Bedwars 8x1 1s Solo Beds Lost", "eigth_one_beds_lost"),
+    ("Bedwars 8x1 1s Solo Kills", "eight_one_kills_bedwars"),
+    ("Bedwars 4x3 3v3 Beds Lost", "four_three_beds_lost_bedwars"),
+    ("Bedwars 4x3 3v3 Deaths", "four_three_deaths_bedwars"),
+    ("Bedwars 4x3 3v3 Final Deaths", "four_three_final_deaths_bedwars"),
+    ("Bedwars 4x3 3v3 Games Played", "four_three_games_played_bedwars"),
+    ("Bedwars 4x3 3v3 Losses", "four_three_losses_bedwars"),
+    ("Bedwars 4x3 3v3 Wins", "four_three_wins_bedwars"),
+    ("Bedwars 8x1 1s Solo Beds Broken", "eight_one_beds_broken_bedwars"),
+    ("Bedwars 8x1 1s Solo Final Kills", "eight_one_final_kills_bedwars"),
+    ("Bedwars 4x3 3v3 Kills", "four_three_kills_bedwars"),
+    ("Bedwars 8x2 2s Duo Wins", "eight_two_wins_bedwars"),
+)
+
+SLUMBER_ITEM_STATS = (
+    ("Slumber Hotel Item: Perfume", "slumber_item_perfume"),
+    ("Slumber Hotel Item: Bed Sheets", "slumber_item_bed_sheets"),
+    ("Slumber Hotel Item: Ender Dust", "slumber_item_ender_dust"),
+    ("Slumber Hotel Item: Imperial Leather", "slumber_item_imperial_leather"),
+    ("Slumber Hotel Item: Indigo's Map", "slumber_item_indigos_map"),
+    ("Slumber Hotel Item: Trusty Rope", "slumber_item_trusty_rope"),
+    ("Slumber Hotel Item: Golden Ticket", "slumber_item_golden_ticket"),
+    ("Slumber Hotel Item: Iron Nugget", "slumber_item_iron_nugget"),
+    ("Slumber Hotel Item: Silver Coins", "slumber_item_silver_coins"),
+    ("Slumber Hotel Item: Nether Star", "slumber_item_nether_star"),
+    ("Slumber Hotel Item: Missing Amulet", "slumber_item_missing_amulet"),
+    ("Slumber Hotel Item: Soul", "slumber_item_soul"),
+    ("Slumber Hotel Item: Comfy Pillow", "slumber_item_comfy_pillow"),
+    ("Slumber Hotel Item: Amulet", "slumber_item_amulet"),
+    ("Slumber Hotel Item: Weapon Mold", "slumber_item_weapon_mold"),
+    ("Slumber Hotel Item: Oasis Water", "slumber_item_oasis_water"),
+    ("Slumber Hotel Item: Enchanted Hammer", "slumber_item_enchanted_hammer"),
+    ("Slumber Hotel Item: Token of Ferocity", "slumber_item_token_of_ferocity"),
+    ("Slumber Hotel Item: Cable", "slumber_item_cable"),
+    ("Slumber Hotel Item: Timeworn Mystery Box", "slumber_item_timeworn_mystery_box"),
+    ("Slumber Hotel Item: Proof of Success", "slumber_item_proof_of_success"),
+    ("Slumber Hotel Item: Gold Bar", "slumber_item_gold_bar"),
+    ("Slumber Hotel Item: Spark Plug", "slumber_item_spark_plug"),
+    ("Slumber Hotel Item: Ratman Mask", "slumber_item_ratman_mask"),
+    ("Slumber Hotel Item: Dwarven Mithril", "slumber_item_dwarven_mithril"),
+    ("Slumber Hotel Item: Diamond Fragment", "slumber_item_diamond_fragment"),
+    ("Slumber Hotel Item: Limbo Dust", "slumber_item_limbo_dust"),
+    ("Slumber Hotel Item: Boots", "slumber_item_boots"),
+    ("Slumber Hotel Item: Air Freshener", "slumber_item_air_freshener"),
+    ("Slumber Hotel Item: Cleaned Up Murder Knife", "slumber_item_cleaned_up_murder_knife"),
+    ("Slumber Hotel Item: Moon Stone Nugget", "slumber_item_moon_stone_nugget"),
+    ("Slumber Hotel Item: Emerald Shard", "slumber_item_emerald_shard"),
+    ("Slumber Hotel Item: Unused Bomb Materials", "slumber_item_unused_bomb_materials"),
+    ("Slumber Hotel Item: Blitz Star", "slumber_item_blitz_star"),
+    ("Slumber Hotel Item: Faded Blitz Star", "slumber_item_faded_blitz_star"),
+    ("Slumber Hotel Item: Nether Star", "slumber_item_nether_star"),
+    ("Slumber Hotel Item: Silver Blade Replay", "slumber_item_silver_blade_replay"),
+    ("Slumber Hotel Item: Gloves", "slumber_item_gloves"),
+    ("Slumber Hotel Item: Victim Photo", "slumber_item_victim_photo"),
+    ("Slumber Hotel Item: Murder Weapon", "slumber_item_murder_weapon"),
+    ("Slumber Hotel Item: Block of Mega Walls Obsidian", "slumber_item_block_of_mega_walls_obsidian"),
+    ("Slumber Hotel Item: Discarded Kart Wheel", "slumber_item_discarded_kart_wheel"),
+    ("Slumber Hotel Item: Glowing Sand Paper", "slumber_item_glowing_sand_paper"),
+)
+
+SLUMBER_STATS = (
+    ("Slumber Hotel Total Tickets Earned", "slumber_item_total_tickets_earned"),
+)
+
+# (labels, keys) per section, in the same order get_data resolves the sections
+STAT_COLUMNS = tuple(
+    tuple(zip(*stats))
+    for stats in (PLAYER_STATS, SKYWARS_STATS, BEDWARS_STATS, SLUMBER_ITEM_STATS, SLUMBER_STATS)
+)
+
+# raw millisecond timestamps, shown as-is rather than as counts
+TIMESTAMP_STATS = {"First Time Played", "Last Time Played"}
+
+
+def format_float(v):
+    # the API sends some counts as floats (e.g. 1939.0); show them like ints
+    return f"{int(v):,}" if v.is_integer() else f"{v:,.2f}"
+
+
+# display formatting by exact type; anything not listed (bool, str) goes through str
+FORMATTERS = {
+    int: "{:,}".format,
+    float: format_float,
+    type(None): lambda v: "N/A",
+}
 
-    with open("cache.json", "w") as f:
-        json.dump(d, f)
 
-    
-def get_cached(player: str):
-    with open("cache.json", "r") as f:
-        d = json.load(f)
-        if player in d:
-            return d[player]
-        else:
-            return None
-        
 def get_or_none(data: dict, keys: list):
     for key in keys:
         if key in data:
@@ -205,351 +388,41 @@ def get_or_none(data: dict, keys: list):
         else:
             return None
     return data
-        
 
-def get_data(player: str):
-    if get_cached(player):
-        d = get_cached(player)
-    else:
-        url = f"https://api.hypixel.net/player?name={player}"
-        headers = {
-            "API-Key": config.API_KEY
-        }
-        response = requests.get(url, headers=headers)
-        d = response.json()
-        cache_data(player, d)
-    data = {
-        # "First Time Played": d["player"]["firstLogin"],
-        "First Time Played": get_or_none(d, ["player", "firstLogin"]),
-        # "Last Time Played": d["player"]["lastLogin"],
-        "Last Time Played": get_or_none(d, ["player", "lastLogin"]),
-        # "Skywars Souls": d["player"]["stats"]["SkyWars"]["souls"],
-        "Skywars Souls": get_or_none(d, ["player", "stats", "SkyWars", "souls"]),
-        # "Skywars Coins": d["player"]["stats"]["SkyWars"]["coins"],
-        "Skywars Coins": get_or_none(d, ["player", "stats", "SkyWars", "coins"]),
-        # "Skywars Experience": d["player"]["stats"]["SkyWars"]["skywars_experience"],
-        "Skywars Experience": get_or_none(d, ["player", "stats", "SkyWars", "skywars_experience"]),
-        # "Skywars Deaths": d["player"]["stats"]["SkyWars"]["deaths"],
-        "Skywars Deaths": get_or_none(d, ["player", "stats", "SkyWars", "deaths"]),
-        # "Skywars Deaths Solo": d["player"]["stats"]["SkyWars"]["deaths_solo"],
-        "Skywars Deaths Solo": get_or_none(d, ["player", "stats", "SkyWars", "deaths_solo"]),
-        # "Skywars Deaths Solo Normal": d["player"]["stats"]["SkyWars"]["deaths_solo_normal"],
-        "Skywars Deaths Solo Normal": get_or_none(d, ["player", "stats", "SkyWars", "deaths_solo_normal"]),
-        # "Skywars Losses": d["player"]["stats"]["SkyWars"]["losses"],
-        "Skywars Losses": get_or_none(d, ["player", "stats", "SkyWars", "losses"]),
-        # "Skywars Losses Solo": d["player"]["stats"]["SkyWars"]["losses_solo"],
-        "Skywars Losses Solo": get_or_none(d, ["player", "stats", "SkyWars", "losses_solo"]),
-        # "Skywars Losses Solo Normal": d["player"]["stats"]["SkyWars"]["losses_solo_normal"],
-        "Skywars Losses Solo Normal": get_or_none(d, ["player", "stats", "SkyWars", "losses_solo_normal"]),
-        # "Skywars Win Streak": d["player"]["stats"]["SkyWars"]["win_streak"],
-        "Skywars Win Streak": get_or_none(d, ["player", "stats", "SkyWars", "win_streak"]),
-        # "Skywars Games Solo": d["player"]["stats"]["SkyWars"]["games_solo"],
-        "Skywars Games Solo": get_or_none(d, ["player", "stats", "SkyWars", "games_solo"]),
-        # "Skywars Wins": d["player"]["stats"]["SkyWars"]["wins"],
-        "Skywars Wins": get_or_none(d, ["player", "stats", "SkyWars", "wins"]),
-        # "Skywars Wins Solo": d["player"]["stats"]["SkyWars"]["wins_solo"],
-        "Skywars Wins Solo": get_or_none(d, ["player", "stats", "SkyWars", "wins_solo"]),
-        # "Skywars Wins Solo Normal": d["player"]["stats"]["SkyWars"]["wins_solo_normal"],
-        "Skywars Wins Solo Normal": get_or_none(d, ["player", "stats", "SkyWars", "wins_solo_normal"]),
-        # "Skywars Kills": d["player"]["stats"]["SkyWars"]["kills"],
-        "Skywars Kills": get_or_none(d, ["player", "stats", "SkyWars", "kills"]),
-        # "Skywars Kills Solo": d["player"]["stats"]["SkyWars"]["kills_solo"],
-        "Skywars Kills Solo": get_or_none(d, ["player", "stats", "SkyWars", "kills_solo"]),
-        # "Skywars Kills Solo Normal": d["player"]["stats"]["SkyWars"]["kills_solo_normal"],
-        "Skywars Kills Solo Normal": get_or_none(d, ["player", "stats", "SkyWars", "kills_solo_normal"]),
-        # "Skywars Souls Gathered": d["player"]["stats"]["SkyWars"]["souls_gathered"],
-        "Skywars Souls Gathered": get_or_none(d, ["player", "stats", "SkyWars", "souls_gathered"]),
-        # "Skywars Eggs Thrown": d["player"]["stats"]["SkyWars"]["egg_thrown"],
-        "Skywars Eggs Thrown": get_or_none(d, ["player", "stats", "SkyWars", "egg_thrown"]),
-        # "Skywars Assists": d["player"]["stats"]["SkyWars"]["assists"],
-        "Skywars Assists": get_or_none(d, ["player", "stats", "SkyWars", "assists"]),
-        # "Skywars Assists Solo": d["player"]["stats"]["SkyWars"]["assists_solo"],
-        "Skywars Assists Solo": get_or_none(d, ["player", "stats", "SkyWars", "assists_solo"]),
-        # "Skywars Enderpearls Thrown": d["player"]["stats"]["SkyWars"]["enderpearls_thrown"],
-        "Skywars Enderpearls Thrown": get_or_none(d, ["player", "stats", "SkyWars", "enderpearls_thrown"]),
-        # "Skywars Deaths Solo Insane": d["player"]["stats"]["SkyWars"]["deaths_solo_insane"],
-        "Skywars Deaths Solo Insane": get_or_none(d, ["player", "stats", "SkyWars", "deaths_solo_insane"]),
-        # "Skywars Losses Solo Insane": d["player"]["stats"]["SkyWars"]["losses_solo_insane"],
-        "Skywars Losses Solo Insane": get_or_none(d, ["player", "stats", "SkyWars", "losses_solo_insane"]),
-        # "Skywars Arrows Hit": d["player"]["stats"]["SkyWars"]["arrows_hit"],
-        "Skywars Arrows Hit": get_or_none(d, ["player", "stats", "SkyWars", "arrows_hit"]),
-        # "Skywars Arrows Shot": d["player"]["stats"]["SkyWars"]["arrows_shot"],
-        "Skywars Arrows Shot": get_or_none(d, ["player", "stats", "SkyWars", "arrows_shot"]),
-        # "Skywars Deaths Team": d["player"]["stats"]["SkyWars"]["deaths_team"],
-        "Skywars Deaths Team": get_or_none(d, ["player", "stats", "SkyWars", "deaths_team"]),
-        # "Skywars Deaths Team Insane": d["player"]["stats"]["SkyWars"]["deaths_team_insane"],
-        "Skywars Deaths Team Insane": get_or_none(d, ["player", "stats", "SkyWars", "deaths_team_insane"]),
-        # "Skywars Losses Team": d["player"]["stats"]["SkyWars"]["losses_team"],
-        "Skywars Losses Team": get_or_none(d, ["player", "stats", "SkyWars", "losses_team"]),
-        # "Skywars Losses Team Insane": d["player"]["stats"]["SkyWars"]["losses_team_insane"],
-        "Skywars Losses Team Insane": get_or_none(d, ["player", "stats", "SkyWars", "losses_team_insane"]),
-        # "Skywars Wins Solo Insane": d["player"]["stats"]["SkyWars"]["wins_solo_insane"],
-        "Skywars Wins Solo Insane": get_or_none(d, ["player", "stats", "SkyWars", "wins_solo_insane"]),
-        # "Skywars Kills Solo Insane": d["player"]["stats"]["SkyWars"]["kills_solo_insane"],
-        "Skywars Kills Solo Insane": get_or_none(d, ["player", "stats", "SkyWars", "kills_solo_insane"]),
-        # "Skywars Soul Well": d["player"]["stats"]["SkyWars"]["soul_well"],
-        "Skywars Soul Well": get_or_none(d, ["player", "stats", "SkyWars", "soul_well"]),
-        # "Skywars Soul Well Rares": d["player"]["stats"]["SkyWars"]["soul_well_rares"],
-        "Skywars Soul Well Rares": get_or_none(d, ["player", "stats", "SkyWars", "soul_well_rares"]),
-        # "Skywars Games Team": d["player"]["stats"]["SkyWars"]["games_team"],
-        "Skywars Games Team": get_or_none(d, ["player", "stats", "SkyWars", "games_team"]),
-        # "Skywars Heads": d["player"]["stats"]["SkyWars"]["heads"],
-        "Skywars Heads": get_or_none(d, ["player", "stats", "SkyWars", "heads"]),
-        # "Skywars Heads Decent": d["player"]["stats"]["SkyWars"]["heads_decent"],
-        "Skywars Heads Decent": get_or_none(d, ["player", "stats", "SkyWars", "heads_decent"]),
-        # "Skywars Heads Decent Team": d["player"]["stats"]["SkyWars"]["heads_decent_team"],
-        "Skywars Heads Decent Team": get_or_none(d, ["player", "stats", "SkyWars", "heads_decent_team"]),
-        # "Skywars Heads Team": d["player"]["stats"]["SkyWars"]["heads_team"],
-        "Skywars Heads Team": get_or_none(d, ["player", "stats", "SkyWars", "heads_team"]),
-        # "Skywars Kills Team": d["player"]["stats"]["SkyWars"]["kills_team"],
-        "Skywars Kills Team": get_or_none(d, ["player", "stats", "SkyWars", "kills_team"]),
-        # "Skywars Kills Team Insane": d["player"]["stats"]["SkyWars"]["kills_team_insane"],
-        "Skywars Kills Team Insane": get_or_none(d, ["player", "stats", "SkyWars", "kills_team_insane"]),
-        # "Skywars Assists Team": d["player"]["stats"]["SkyWars"]["assists_team"],
-        "Skywars Assists Team": get_or_none(d, ["player", "stats", "SkyWars", "assists_team"]),
-        # "Skywars Deaths Team Normal": d["player"]["stats"]["SkyWars"]["deaths_team_normal"],
-        "Skywars Deaths Team Normal": get_or_none(d, ["player", "stats", "SkyWars", "deaths_team_normal"]),
-        # "Skywars Wins Team": d["player"]["stats"]["SkyWars"]["wins_team"],
-        "Skywars Wins Team": get_or_none(d, ["player", "stats", "SkyWars", "wins_team"]),
-        # "Skywars Wins Team Normal": d["player"]["stats"]["SkyWars"]["wins_team_normal"],
-        "Skywars Wins Team Normal": get_or_none(d, ["player", "stats", "SkyWars", "wins_team_normal"]),
-        # "Skywars Losses Team Normal": d["player"]["stats"]["SkyWars"]["losses_team_normal"],
-        "Skywars Losses Team Normal": get_or_none(d, ["player", "stats", "SkyWars", "losses_team_normal"]),
-        # "Skywars Kills Team Normal": d["player"]["stats"]["SkyWars"]["kills_team_normal"],
-        "Skywars Kills Team Normal": get_or_none(d, ["player", "stats", "SkyWars", "kills_team_normal"]),
-        # "Skywars Soul Well Legendaries": d["player"]["stats"]["SkyWars"]["soul_well_legendaries"],
-        "Skywars Soul Well Legendaries": get_or_none(d, ["player", "stats", "SkyWars", "soul_well_legendaries"]),
-        # "Skywars Heads Tasty": d["player"]["stats"]["SkyWars"]["heads_tasty"],
-        "Skywars Heads Tasty": get_or_none(d, ["player", "stats", "SkyWars", "heads_tasty"]),
-        # "Skywars Heads Tasty Team": d["player"]["stats"]["SkyWars"]["heads_tasty_team"],
-        "Skywars Heads Tasty Team": get_or_none(d, ["player", "stats", "SkyWars", "heads_tasty_team"]),
-        # "Skywars Heads Eww": d["player"]["stats"]["SkyWars"]["heads_eww"],
-        "Skywars Heads Eww": get_or_none(d, ["player", "stats", "SkyWars", "heads_eww"]),
-        # "Skywars Heads Eww Team": d["player"]["stats"]["SkyWars"]["heads_eww_team"],
-        "Skywars Heads Eww Team": get_or_none(d, ["player", "stats", "SkyWars", "heads_eww_team"]),
-        # "Skywars Heads Meh": d["player"]["stats"]["SkyWars"]["heads_meh"],
-        "Skywars Heads Meh": get_or_none(d, ["player", "stats", "SkyWars", "heads_meh"]),
-        # "Skywars Heads Meh Team": d["player"]["stats"]["SkyWars"]["heads_meh_team"],
-        "Skywars Heads Meh Team": get_or_none(d, ["player", "stats", "SkyWars", "heads_meh_team"]),
-        # "Skywars Heads Yucky": d["player"]["stats"]["SkyWars"]["heads_yucky"],
-        "Skywars Heads Yucky": get_or_none(d, ["player", "stats", "SkyWars", "heads_yucky"]),
-        # "Skywars Heads Heavenly": d["player"]["stats"]["SkyWars"]["heads_heavenly"],
-        "Skywars Heads Heavenly": get_or_none(d, ["player", "stats", "SkyWars", "heads_heavenly"]),
-        # "Skywars Heads Divine": d["player"]["stats"]["SkyWars"]["heads_divine"],
-        "Skywars Heads Divine": get_or_none(d, ["player", "stats", "SkyWars", "heads_divine"]),
-        # "Skywars Heads Salty": d["player"]["stats"]["SkyWars"]["heads_salty"],
-        "Skywars Heads Salty": get_or_none(d, ["player", "stats", "SkyWars", "heads_salty"]),
-        # "Skywars Heads Succulent": d["player"]["stats"]["SkyWars"]["heads_succulent"],
-        "Skywars Heads Succulent": get_or_none(d, ["player", "stats", "SkyWars", "heads_succulent"]),
-        # "Bedwars Experience": d["player"]["stats"]["Bedwars"]["Experience"],
-        "Bedwars Experience": get_or_none(d, ["player", "stats", "Bedwars", "Experience"]),  # d["player"]["stats"]["Bedwars"]["Experience"],
-        # "Bedwars Winstreak": d["player"]["stats"]["Bedwars"]["winstreak"],
-        "Bedwars Winstreak": get_or_none(d, ["player", "stats", "Bedwars", "winstreak"]),
-        # "Bedwars Coins": d["player"]["stats"]["Bedwars"]["coins"],
-        "Bedwars Coins": get_or_none(d, ["player", "stats", "Bedwars", "coins"]),
-        # "Bedwars Deaths": d["player"]["stats"]["Bedwars"]["deaths"],
-        "Bedwars Deaths": get_or_none(d, ["player", "stats", "Bedwars", "deaths_bedwars"]),
-        # "Bedwars 4x4 4s Deaths": d["player"]["stats"]["Bedwars"]["four_four_deaths_bedwars"],
-        "Bedwars 4x4 4s Deaths": get_or_none(d, ["player", "stats", "Bedwars", "four_four_deaths_bedwars"]),
-        # "Bedwars 4x4 4s Games Played": d["player"]["stats"]["Bedwars"]["four_four_games_played_bedwars"],
-        "Bedwars 4x4 4s Games Played": get_or_none(d, ["player", "stats", "Bedwars", "four_four_games_played_bedwars"]),
-        # "Bedwars 4x4 4s Kills": d["player"]["stats"]["Bedwars"]["four_four_kills_bedwars"],
-        "Bedwars 4x4 4s Kills": get_or_none(d, ["player", "stats", "Bedwars", "four_four_kills_bedwars"]),
-        # "Bedwars 4x4 4s Wins": d["player"]["stats"]["Bedwars"]["four_four_wins_bedwars"],
-        "Bedwars 4x4 4s Wins": get_or_none(d, ["player", "stats", "Bedwars", "four_four_wins_bedwars"]),
-        # "Bedwars Games Played": d["player"]["stats"]["Bedwars"]["games_played_bedwars"],
-        "Bedwars Games Played": get_or_none(d, ["player", "stats", "Bedwars", "games_played_bedwars"]),
-        # "Bedwars Gold Resources Collected": d["player"]["stats"]["Bedwars"]["gold_resources_collected_bedwars"],
-        "Bedwars Gold Resources Collected": get_or_none(d, ["player", "stats", "Bedwars", "gold_resources_collected_bedwars"]),
-        # "Bedwars Iron Resources Collected": d["player"]["stats"]["Bedwars"]["iron_resources_collected_bedwars"],
-        "Bedwars Iron Resources Collected": get_or_none(d, ["player", "stats", "Bedwars", "iron_resources_collected_bedwars"]),
-        # "Bedwars Kills": d["player"]["stats"]["Bedwars"]["kills_bedwars"],
-        "Bedwars Kills": get_or_none(d, ["player", "stats", "Bedwars", "kills_bedwars"]),
-        # "Bedwars Wins": d["player"]["stats"]["Bedwars"]["wins_bedwars"],
-        "Bedwars Wins": get_or_none(d, ["player", "stats", "Bedwars", "wins_bedwars"]),
-        # "Bedwars Beds Broken": d["player"]["stats"]["Bedwars"]["beds_broken_bedwars"],
-        "Bedwars Beds Broken": get_or_none(d, ["player", "stats", "Bedwars", "beds_broken_bedwars"]),
-        # "Bedwars 8x2 2s Duo Beds Broken": d["player"]["stats"]["Bedwars"]["eight_two_beds_broken_bedwars"],
-        "Bedwars 8x2 2s Duo Beds Broken": get_or_none(d, ["player", "stats", "Bedwars", "eight_two_beds_broken_bedwars"]),
-        # "Bedwars 8x2 2s Duo Beds Lost": d["player"]["stats"]["Bedwars"]["eight_two_beds_lost_bedwars"],
-        "Bedwars 8x2 2s Duo Beds Lost": get_or_none(d, ["player", "stats", "Bedwars", "eight_two_beds_lost_bedwars"]),
-        # "Bedwars 8x2 2s Duo Deaths": d["player"]["stats"]["Bedwars"]["eight_two_deaths_bedwars"],
-        "Bedwars 8x2 2s Duo Deaths": get_or_none(d, ["player", "stats", "Bedwars", "eight_two_deaths_bedwars"]),
-        # "Bedwars 8x2 2s Duo Final Deaths": d["player"]["stats"]["Bedwars"]["eight_two_final_deaths_bedwars"],
-        "Bedwars 8x2 2s Duo Final Deaths": get_or_none(d, ["player", "stats", "Bedwars", "eight_two_final_deaths_bedwars"]),
-        # "Bedwars 8x2 2s Duo Final Kills": d["player"]["stats"]["Bedwars"]["eight_two_final_kills_bedwars"],
-        "Bedwars 8x2 2s Duo Final Kills": get_or_none(d, ["player", "stats", "Bedwars", "eight_two_final_kills_bedwars"]),
-        # "Bedwars 8x2 2s Duo Games Played": d["player"]["stats"]["Bedwars"]["eight_two_games_played_bedwars"],
-        "Bedwars 8x2 2s Duo Games Played": get_or_none(d, ["player", "stats", "Bedwars", "eight_two_games_played_bedwars"]),
-        # "Bedwars 8x2 2s Duo Losses": d["player"]["stats"]["Bedwars"]["eight_two_losses_bedwars"],
-        "Bedwars 8x2 2s Duo Losses": get_or_none(d, ["player", "stats", "Bedwars", "eight_two_losses_bedwars"]),
-        # "Bedwars Final Kills": d["player"]["stats"]["Bedwars"]["final_kills_bedwars"],
-        "Bedwars Final Kills": get_or_none(d, ["player", "stats", "Bedwars", "final_kills_bedwars"]),
-        # "Bedwars Losses": d["player"]["stats"]["Bedwars"]["losses_bedwars"],
-        "Bedwars Losses": get_or_none(d, ["player", "stats", "Bedwars", "losses_bedwars"]),
-        # "Bedwars 8x2 2s Duo Kills": d["player"]["stats"]["Bedwars"]["eight_two_kills_bedwars"],
-        "Bedwars 8x2 2s Duo Kills": get_or_none(d, ["player", "stats", "Bedwars", "eight_two_kills_bedwars"]),
-        # "Bedwars Void Kills": d["player"]["stats"]["Bedwars"]["void_kills_bedwars"],
-        "Bedwars Void Kills": get_or_none(d, ["player", "stats", "Bedwars", "void_kills_bedwars"]),
-        # "Bedwars Emerald Resources Collected": d["player"]["stats"]["Bedwars"]["emerald_resources_collected_bedwars"],
-        "Bedwars Emerald Resources Collected": get_or_none(d, ["player", "stats", "Bedwars", "emerald_resources_collected_bedwars"]),
-        # "Bedwars 4x4 4s Beds Lost": d["player"]["stats"]["Bedwars"]["four_four_beds_lost_bedwars"],
-        "Bedwars 4x4 4s Beds Lost": get_or_none(d, ["player", "stats", "Bedwars", "four_four_beds_lost_bedwars"]),
-        # "Bedwars 4x4 4s Final Deaths": d["player"]["stats"]["Bedwars"]["four_four_final_deaths_bedwars"],
-        "Bedwars 4x4 4s Final Deaths": get_or_none(d, ["player", "stats", "Bedwars", "four_four_final_deaths_bedwars"]),
-        # "Bedwars 4x4 4s Losses": d["player"]["stats"]["Bedwars"]["four_four_losses_bedwars"],
-        "Bedwars 4x4 4s Losses": get_or_none(d, ["player", "stats", "Bedwars", "four_four_losses_bedwars"]),
-        # "Bedwars 2x4 4v4 Beds Lost": d["player"]["stats"]["Bedwars"]["two_four_beds_lost_bedwars"],
-        "Bedwars 2x4 4v4 Beds Lost": get_or_none(d, ["player", "stats", "Bedwars", "two_four_beds_lost_bedwars"]),
-        # "Bedwars 2x4 4v4 Deaths": d["player"]["stats"]["Bedwars"]["two_four_deaths_bedwars"],
-        "Bedwars 2x4 4v4 Deaths": get_or_none(d, ["player", "stats", "Bedwars", "two_four_deaths_bedwars"]),
-        # "Bedwars 2x4 4v4 Final Deaths": d["player"]["stats"]["Bedwars"]["two_four_final_deaths_bedwars"],
-        "Bedwars 2x4 4v4 Final Deaths": get_or_none(d, ["player", "stats", "Bedwars", "two_four_final_deaths_bedwars"]),
-        # "Bedwars 2x4 4v4 Games Played": d["player"]["stats"]["Bedwars"]["two_four_games_played_bedwars"],
-        "Bedwars 2x4 4v4 Games Played": get_or_none(d, ["player", "stats", "Bedwars", "two_four_games_played_bedwars"]),
-        # "Bedwars 2x4 4v4 Losses": d["player"]["stats"]["Bedwars"]["two_four_losses_bedwars"],
-        "Bedwars 2x4 4v4 Losses": get_or_none(d, ["player", "stats", "Bedwars", "two_four_losses_bedwars"]),
-        # "Bedwars 2x4 4v4 Wins": d["player"]["stats"]["Bedwars"]["two_four_wins_bedwars"],
-        "Bedwars 2x4 4v4 Wins": get_or_none(d, ["player", "stats", "Bedwars", "two_four_wins_bedwars"]),
-        # "Bedwars Fall Deaths": d["player"]["stats"]["Bedwars"]["fall_deaths_bedwars"],
-        "Bedwars Fall Deaths": get_or_none(d, ["player", "stats", "Bedwars", "fall_deaths_bedwars"]),
-        # "Bedwars Fall Kills": d["player"]["stats"]["Bedwars"]["fall_kills_bedwars"],`1
-        "Bedwars Fall Kills": get_or_none(d, ["player", "stats", "Bedwars", "fall_kills_bedwars"]),
-        # "Bedwars 2x4 4v4 Kills": d["player"]["stats"]["Bedwars"]["two_four_kills_bedwars"],
-        "Bedwars 2x4 4v4 Kills": get_or_none(d, ["player", "stats", "Bedwars", "two_four_kills_bedwars"]),
-        # "Bedwars Diamond Resources Collected": d["player"]["stats"]["Bedwars"]["diamond_resources_collected_bedwars"],
-        "Bedwars Diamond Resources Collected": get_or_none(d, ["player", "stats", "Bedwars", "diamond_resources_collected_bedwars"]),
-        # "Bedwars 4x4 4s Void Kills": d["player"]["stats"]["Bedwars"]["four_four_void_kills_bedwars"],
-        "Bedwars 4x4 4s Void Kills": get_or_none(d, ["player", "stats", "Bedwars", "four_four_void_kills_bedwars"]),
-        # "Bedwars Projectile Kills": d["player"]["stats"]["Bedwars"]["projectile_kills_bedwars"],
-        "Bedwars Projectile Kills": get_or_none(d, ["player", "stats", "Bedwars", "projectile_kills_bedwars"]),
-        # "Bedwars 2x4 4v4 Beds Broken": d["player"]["stats"]["Bedwars"]["two_four_beds_broken_bedwars"],
-        "Bedwars 2x4 4v4 Beds Broken": get_or_none(d, ["player", "stats", "Bedwars", "two_four_beds_broken_bedwars"]),
-        # "Bedwars 8x1 1s Solo Deaths": d["player"]["stats"]["Bedwars"]["eight_one_deaths_bedwars"],
-        "Bedwars 8x1 1s Solo Deaths": get_or_none(d, ["player", "stats", "Bedwars", "eight_one_deaths_bedwars"]),
-        # "Bedwars 8x1 1s Solo Final Deaths": d["player"]["stats"]["Bedwars"]["eight_one_final_deaths_bedwars"], 
-        "Bedwars 8x1 1s Solo Final Deaths": get_or_none(d, ["player", "stats", "Bedwars", "eight_one_final_deaths_bedwars"]),
-        # "Bedwars 8x1 1s Solo Games Played": d["player"]["stats"]["Bedwars"]["eight_one_games_played_bedwars"],
-        "Bedwars 8x1 1s Solo Games Played": get_or_none(d, ["player", "stats", "Bedwars", "eight_one_games_played_bedwars"]),
-        # "Bedwars 8x1 1s Solo Losses": d["player"]["stats"]["Bedwars"]["eight_one_losses_bedwars"],
-        "Bedwars 8x1 1s Solo Losses": get_or_none(d, ["player", "stats", "Bedwars", "eight_one_losses_bedwars"]),
-        # "Bedwars 8x1 1s Solo Beds Lost": d["player"]["stats"]["Bedwars"]["eigth_one_beds_lost"],
-        "Bedwars 8x1 1s Solo Beds Lost": get_or_none(d, ["player", "stats", "Bedwars", "eigth_one_beds_lost"]),
-        # "Bedwars 8x1 1s Solo Kills": d["player"]["stats"]["Bedwars"]["eight_one_kills_bedwars"],
-        "Bedwars 8x1 1s Solo Kills": get_or_none(d, ["player", "stats", "Bedwars", "eight_one_kills_bedwars"]),
-        # "Bedwars 4x3 3v3 Beds Lost": d["player"]["stats"]["Bedwars"]["four_three_beds_lost_bedwars"],
-        "Bedwars 4x3 3v3 Beds Lost": get_or_none(d, ["player", "stats", "Bedwars", "four_three_beds_lost_bedwars"]),
-        # "Bedwars 4x3 3v3 Deaths": d["player"]["stats"]["Bedwars"]["four_three_deaths_bedwars"],
-        "Bedwars 4x3 3v3 Deaths": get_or_none(d, ["player", "stats", "Bedwars", "four_three_deaths_bedwars"]),
-        # "Bedwars 4x3 3v3 Final Deaths": d["player"]["stats"]["Bedwars"]["four_three_final_deaths_bedwars"],
-        "Bedwars 4x3 3v3 Final Deaths": get_or_none(d, ["player", "stats", "Bedwars", "four_three_final_deaths_bedwars"]),
-        # "Bedwars 4x3 3v3 Games Played": d["player"]["stats"]["Bedwars"]["four_three_games_played_bedwars"],
-        "Bedwars 4x3 3v3 Games Played": get_or_none(d, ["player", "stats", "Bedwars", "four_three_games_played_bedwars"]),
-        # "Bedwars 4x3 3v3 Losses": d["player"]["stats"]["Bedwars"]["four_three_losses_bedwars"],
-        "Bedwars 4x3 3v3 Losses": get_or_none(d, ["player", "stats", "Bedwars", "four_three_losses_bedwars"]),
-        # "Bedwars 4x3 3v3 Wins": d["player"]["stats"]["Bedwars"]["four_three_wins_bedwars"],
-        "Bedwars 4x3 3v3 Wins": get_or_none(d, ["player", "stats", "Bedwars", "four_three_wins_bedwars"]),
-        # "Bedwars 8x1 1s Solo Beds Broken": d["player"]["stats"]["Bedwars"]["eight_one_beds_broken_bedwars"],
-        "Bedwars 8x1 1s Solo Beds Broken": get_or_none(d, ["player", "stats", "Bedwars", "eight_one_beds_broken_bedwars"]),
-        # "Bedwars 8x1 1s Solo Final Kills": d["player"]["stats"]["Bedwars"]["eight_one_final_kills_bedwars"],
-        "Bedwars 8x1 1s Solo Final Kills": get_or_none(d, ["player", "stats", "Bedwars", "eight_one_final_kills_bedwars"]),
-        # "Bedwars 4x3 3v3 Kills": d["player"]["stats"]["Bedwars"]["four_three_kills_bedwars"],
-        "Bedwars 4x3 3v3 Kills": get_or_none(d, ["player", "stats", "Bedwars", "four_three_kills_bedwars"]),
-        # "Bedwars 8x2 2s Duo Wins": d["player"]["stats"]["Bedwars"]["eight_two_wins_bedwars"],
-        "Bedwars 8x2 2s Duo Wins": get_or_none(d, ["player", "stats", "Bedwars", "eight_two_wins_bedwars"]),
-        # "Slumber Hotel Item: Perfume": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["perfume"],
-        "Slumber Hotel Item: Perfume": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_perfume"]),
-        # "Slumber Hotel Item: Bed Sheets": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["bed_sheets"],
-        "Slumber Hotel Item: Bed Sheets": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_bed_sheets"]),
-        # "Slumber Hotel Item: Ender Dust": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["ender_dust"],
-        "Slumber Hotel Item: Ender Dust": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_ender_dust"]),
-        # "Slumber Hotel Item: Imperial Leather": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["imperial_leather"],
-        "Slumber Hotel Item: Imperial Leather": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_imperial_leather"]),
-        # "Slumber Hotel Item: Indigo's Map": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["indigos_map"],
-        "Slumber Hotel Item: Indigo's Map": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_indigos_map"]),
-        # "Slumber Hotel Item: Trusty Rope": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["trusty_rope"],
-        "Slumber Hotel Item: Trusty Rope": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_trusty_rope"]),
-        # "Slumber Hotel Item: Golden Ticket": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["golden_ticket"],
-        "Slumber Hotel Item: Golden Ticket": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_golden_ticket"]),
-        # "Slumber Hotel Item: Iron Nugget": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["iron_nugget"],
-        "Slumber Hotel Item: Iron Nugget": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_iron_nugget"]),
-        # "Slumber Hotel Item: Silver Coins": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["silver_coins"],
-        "Slumber Hotel Item: Silver Coins": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_silver_coins"]),
-        # "Slumber Hotel Item: Nether Star": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["nether_star"],
-        "Slumber Hotel Item: Nether Star": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_nether_star"]),
-        # "Slumber Hotel Item: Missing Amulet": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["missing_amulet"],
-        "Slumber Hotel Item: Missing Amulet": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_missing_amulet"]),
-        # "Slumber Hotel Item: Soul": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["soul"],
-        "Slumber Hotel Item: Soul": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_soul"]),
-        # "Slumber Hotel Item: Comfy Pillow": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["comfy_pillow"]
-        "Slumber Hotel Item: Comfy Pillow": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_comfy_pillow"]),
-        # "Slumber Hotel Item: Amulet": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["amulet"],
-        "Slumber Hotel Item: Amulet": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_amulet"]),
-        # "Slumber Hotel Item: Weapon Mold": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["weapon_mold"],
-        "Slumber Hotel Item: Weapon Mold": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_weapon_mold"]),
-        # "Slumber Hotel Item: Oasis Water": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["oasis_water"],
-        "Slumber Hotel Item: Oasis Water": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_oasis_water"]),
-        # "Slumber Hotel Item: Enchanted Hammer": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["enchanted_hammer"],
-        "Slumber Hotel Item: Enchanted Hammer": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_enchanted_hammer"]),
-        # "Slumber Hotel Item: Token of Ferocity": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["token_of_ferocity"],
-        "Slumber Hotel Item: Token of Ferocity": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_token_of_ferocity"]),
-        # "Slumber Hotel Item: Cable": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["cable"],
-        "Slumber Hotel Item: Cable": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_cable"]),
-        # "Slumber Hotel Item: Timeworn Mystery Box": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["timeworn_mystery_box"],
-        "Slumber Hotel Item: Timeworn Mystery Box": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_timeworn_mystery_box"]),
-        # "Slumber Hotel Item: Proof of Success": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["proof_of_success"],
-        "Slumber Hotel Item: Proof of Success": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_proof_of_success"]),
-        # "Slumber Hotel Item: Gold Bar": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["gold_bar"],
-        "Slumber Hotel Item: Gold Bar": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_gold_bar"]),
-        # "Slumber Hotel Item: Spark Plug": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["spark_plug"],
-        "Slumber Hotel Item: Spark Plug": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_spark_plug"]),
-        # "Slumber Hotel Item: Ratman Mask": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["ratman_mask"],
-        # "Slumber Hotel Item: Ratman Mask": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["ratman_mask"],
-        "Slumber Hotel Item: Ratman Mask": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_ratman_mask"]),
-        # "Slumber Hotel Item: Dwarven Mithril": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["dwarven_mithril"],
-        "Slumber Hotel Item: Dwarven Mithril": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_dwarven_mithril"]),
-        # "Slumber Hotel Item: Diamond Fragment": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["diamond_fragment"],
-        "Slumber Hotel Item: Diamond Fragment": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_diamond_fragment"]),
-        # "Slumber Hotel Item: Limbo Dust": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["limbo_dust"],
-        "Slumber Hotel Item: Limbo Dust": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_limbo_dust"]),
-        # "Slumber Hotel Item: Boots": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["boots"],
-        "Slumber Hotel Item: Boots": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_boots"]),
-        # "Slumber Hotel Item: Air Freshener": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["air_freshener"],
-        "Slumber Hotel Item: Air Freshener": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_air_freshener"]),
-        # "Slumber Hotel Item: Cleaned Up Murder Knife": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["cleaned_up_murder_knife"],
-        "Slumber Hotel Item: Cleaned Up Murder Knife": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_cleaned_up_murder_knife"]),
-        # "Slumber Hotel Item: Moon Stone Nugget": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["moon_stone_nugget"],
-        "Slumber Hotel Item: Moon Stone Nugget": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_moon_stone_nugget"]),
-        # "Slumber Hotel Item: Emerald Shard": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["emerald_shard"],
-        "Slumber Hotel Item: Emerald Shard": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_emerald_shard"]),
-        # "Slumber Hotel Item: Unused Bomb Materials": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["unused_bomb_materials"],
-        "Slumber Hotel Item: Unused Bomb Materials": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_unused_bomb_materials"]),
-        # "Slumber Hotel Item: Blitz Star": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["blitz_star"],
-        "Slumber Hotel Item: Blitz Star": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_blitz_star"]),
-        # "Slumber Hotel Item: Faded Blitz Star": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["faded_blitz_star"],
-        "Slumber Hotel Item: Faded Blitz Star": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_faded_blitz_star"]),
-        # "Slumber Hotel Item: Nether Star": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["nether_star"],
-        "Slumber Hotel Item: Nether Star": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_nether_star"]),
-        # "Slumber Hotel Item: Silver Blade Replay": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["silver_blade_replay"],
-        "Slumber Hotel Item: Silver Blade Replay": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_silver_blade_replay"]),
-        # "Slumber Hotel Item: Gloves": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["gloves"],
-        "Slumber Hotel Item: Gloves": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_gloves"]),
-        # "Slumber Hotel Item: Victim Photo": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["victim_photo"],
-        "Slumber Hotel Item: Victim Photo": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_victim_photo"]),
-        # "Slumber Hotel Item: Murder Weapon": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["murder_weapon"],
-        "Slumber Hotel Item: Murder Weapon": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_murder_weapon"]),
-        # "Slumber Hotel Item: Block of Mega Walls Obsidian": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["block_of_mega_walls_obsidian"],
-        "Slumber Hotel Item: Block of Mega Walls Obsidian": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_block_of_mega_walls_obsidian"]),
-        # "Slumber Hotel Item: Discarded Kart Wheel": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["discarded_kart_wheel"],
-        "Slumber Hotel Item: Discarded Kart Wheel": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_discarded_kart_wheel"]),
-        # "Slumber Hotel Item: Glowing Sand Paper": d["player"]["stats"]["Bedwars"]["slumber"]["quest"]["item"]["glowing_sand_paper"],
-        "Slumber Hotel Item: Glowing Sand Paper": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "quest", "item", "slumber_item_glowing_sand_paper"]),
-        # "Slumber Hotel Total Tickets Earned": d["player"]["stats"]["Bedwars"]["slumber"]["total_tickets_earned"],
-        "Slumber Hotel Total Tickets Earned": get_or_none(d, ["player", "stats", "Bedwars", "slumber", "slumber_item_total_tickets_earned"]),
-    }
+
+def format_value(label, v):
+    if label in TIMESTAMP_STATS and v is not None:
+        return str(v)
+    return FORMATTERS.get(type(v), str)(v)
+
+
+async def get_data(player: str):
+    d = await get_player(player)
+    if d is None:
+        return None
+
+    profile = d.get("player") or {}
+    skywars = get_or_none(profile, ("stats", "SkyWars")) or {}
+    bedwars = get_or_none(profile, ("stats", "Bedwars")) or {}
+    slumber = bedwars.get("slumber") or {}
+    slumber_items = get_or_none(slumber, ("quest", "item")) or {}
+    data = {}
+    sections = (profile, skywars, bedwars, slumber_items, slumber)
+    for (labels, keys), section in zip(STAT_COLUMNS, sections):
+        data.update(zip(labels, map(section.get, keys)))
     return data
 
 
+async def get_many_data(players, concurrency=16):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(player):
+        async with semaphore:
+            return await get_data(player)
+
+    return await asyncio.gather(*(one(p) for p in players), return_exceptions=True)
+
+
 def preprocess(s):
     s = str(s).lower() 
     s = re.sub(r'[^a-z0-9\s]', ' ', s) 
@@ -580,7 +453,10 @@ bot = discord.Bot()
 @bot.command()
 async def stats(ctx, player: str, query: str):
     try:
-        all_data = get_data(player)
+        all_data = await get_data(player)
+        if all_data is None:
+            await ctx.respond(f"Couldn't find any Hypixel data for **{player}**")
+            return
         query = query.lower().strip()
         d = full_data(list(all_data.keys()), all_data, query)
         
@@ -594,7 +470,7 @@ async def stats(ctx, player: str, query: str):
         
         for k, v in d:
             key_str = str(k)[:256]
-            value_str = str(v)[:1024] if v is not None else "N/A"
+            value_str = format_value(k, v)[:1024]
             
             embed.add_field(
                 name=key_str,
@@ -608,9 +484,7 @@ async def stats(ctx, player: str, query: str):
         await ctx.respond(embed=embed)
         
     except Exception as e:
-        resp = f"Player data for **{player}**:\n"
-        for k, v in d:
-            resp += f"{k}: {v}\n"
+        resp = f"Player data for **{player}**:\n" + "".join(f"{k}: {format_value(k, v)}\n" for k, v in d)
         await ctx.respond(resp)
 
 # @bot.command()